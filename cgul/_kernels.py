@@ -0,0 +1,50 @@
+"""Compiled kernels, numba is optional and only imported when a kernel is first needed."""
+
+import functools
+import typing as T
+
+import numpy as np
+
+# Arrays smaller than this are converted with numpy, compiling and dispatching
+# to numba only pays off for large arrays
+NUMBA_MIN_SIZE = 100_000
+
+
+def _linear_convert_kernel(
+    values: np.ndarray, scale: float, offset: float, out: np.ndarray
+) -> None:
+    # numba fuses this array expression into a single loop without temporaries
+    out[:] = values * scale + offset
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_linear_convert() -> T.Union[T.Callable[..., None], None]:
+    try:
+        import numba
+    except ImportError:
+        return None
+    # No parallel=True: the kernel runs in dask and thread pool worker threads, where
+    # numba's threading layer hangs the interpreter at exit
+    return numba.njit(cache=True)(_linear_convert_kernel)  # type: ignore
+
+
+def linear_convert(
+    values: np.ndarray, scale: float, offset: float, dtype: np.dtype
+) -> np.ndarray:
+    """
+    Return values * scale + offset as a new array of the given dtype.
+
+    Large float64 results are computed with numba, if installed, otherwise numpy
+    is used.
+    """
+    kernel = None
+    if values.size >= NUMBA_MIN_SIZE and dtype == np.float64:
+        kernel = _numba_linear_convert()
+    if kernel is None:
+        out = np.multiply(values, scale, dtype=dtype)
+        if offset:
+            out += offset
+        return out
+    out = np.empty(values.shape, dtype=dtype)
+    kernel(np.ascontiguousarray(values).reshape(-1), scale, offset, out.reshape(-1))
+    return out
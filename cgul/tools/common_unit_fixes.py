@@ -45,7 +45,8 @@ def common_unit_fixes(
         data.attrs.pop("Units")
 
     # Common units that need renaming
-    if data.attrs.get("units", "") in list(common_unit_names):
-        data = data.assign_attrs({"units": common_unit_names[data.attrs["units"]]})
+    units = data.attrs.get("units", "")
+    if isinstance(units, str) and units in common_unit_names:
+        data = data.assign_attrs({"units": common_unit_names[units]})
 
     return data
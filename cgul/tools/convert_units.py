@@ -1,11 +1,106 @@
+import functools
 import logging
 import typing as T
 
 import cf_units
+import numpy as np
 import xarray as xr
 
+from .. import _kernels
 from .error_handler import error_handler
 
+# (scale, offset) of common linear conversions, these skip cf-units entirely
+_FAST_CONVERSIONS: T.Dict[T.Tuple[str, str], T.Tuple[float, float]] = {
+    # length
+    ("km", "m"): (1e3, 0.0),
+    ("m", "km"): (1e-3, 0.0),
+    ("cm", "m"): (1e-2, 0.0),
+    ("m", "cm"): (1e2, 0.0),
+    ("mm", "m"): (1e-3, 0.0),
+    ("m", "mm"): (1e3, 0.0),
+    # pressure
+    ("hPa", "Pa"): (1e2, 0.0),
+    ("Pa", "hPa"): (1e-2, 0.0),
+    ("kPa", "Pa"): (1e3, 0.0),
+    ("Pa", "kPa"): (1e-3, 0.0),
+    ("mbar", "Pa"): (1e2, 0.0),
+    ("mbar", "hPa"): (1.0, 0.0),
+    ("kPa", "hPa"): (10.0, 0.0),
+    ("hPa", "kPa"): (0.1, 0.0),
+    # temperature
+    ("degC", "K"): (1.0, 273.15),
+    ("K", "degC"): (1.0, -273.15),
+    # angle
+    ("degrees", "radians"): (np.pi / 180, 0.0),
+    ("radians", "degrees"): (180 / np.pi, 0.0),
+    # time
+    ("s", "hours"): (1 / 3600, 0.0),
+    ("minutes", "hours"): (1 / 60, 0.0),
+    ("days", "hours"): (24.0, 0.0),
+    ("hours", "days"): (1 / 24, 0.0),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_unit(units: str) -> cf_units.Unit:
+    """
+    Return the cf_units.Unit for a units string, parsing each distinct string only once.
+
+    Call ``_cached_unit.cache_clear()`` if the udunits registry is modified.
+    """
+    return cf_units.Unit(units)
+
+
+@functools.lru_cache(maxsize=256)
+def _linear_coefficients(
+    source_units: str, target_units: str
+) -> T.Union[T.Tuple[float, float], None]:
+    """
+    Return the (scale, offset) of the conversion from source_units to target_units.
+
+    The conversion is probed at a few points, None is returned if it is not linear
+    (e.g. logarithmic units) or involves reference times, in which case the full
+    cf-units conversion must be used.
+    """
+    _source_units = _cached_unit(source_units)
+    if _source_units.is_time_reference():
+        return None
+    # Probe over a large span, so that the scale is not swamped by rounding errors
+    # of a large offset. A power of two keeps exact scales (e.g. 1000) exact.
+    span = 2.0**30
+    probe = np.array([0.0, span, 2 * span])
+    converted = _source_units.convert(probe, _cached_unit(target_units))
+    if not np.all(np.isfinite(converted)):
+        return None
+    offset = float(converted[0])
+    scale = float(converted[1] - converted[0]) / span
+    if not np.isclose(converted[2], offset + 2 * span * scale, rtol=1e-12, atol=0.0):
+        return None
+    return scale, offset
+
+
+def _convert_linear(
+    data: xr.DataArray, scale: float, offset: float, target_units: str
+) -> xr.DataArray:
+    # Cast (e.g. integer to float), scale and offset in as few passes as possible
+    dtype = np.result_type(data.dtype, scale)
+    if isinstance(data.data, np.ndarray):
+        # The converted values are a new array, so the rest can be a shallow copy
+        converted = data.copy(
+            deep=False, data=_kernels.linear_convert(data.data, scale, offset, dtype)
+        )
+    else:
+        # Convert dask backed data lazily, chunk by chunk
+        converted = xr.apply_ufunc(
+            _kernels.linear_convert,
+            data,
+            kwargs={"scale": scale, "offset": offset, "dtype": dtype},
+            dask="parallelized",
+            output_dtypes=[dtype],
+        )
+    converted.attrs = {**data.attrs, "units": target_units}
+    return converted
+
 
 def convert_units(
     data: xr.DataArray,
@@ -51,34 +146,54 @@ def convert_units(
     if target_units == source_units:
         return data
 
-    try:
-        _target_units = cf_units.Unit(target_units)
-    except ValueError:
-        error_handler(
-            f"Target units for {data.name} ({target_units}) are not recognised by cf-units.\n",
-            logger,
-            warn_extra="Units will not be converted.\n",
-            error_mode=error_mode,
-        )
-        return data
+    # Common linear conversions skip cf-units entirely
+    coefficients = _FAST_CONVERSIONS.get((source_units, target_units))
+    if coefficients is None:
+        try:
+            _target_units = _cached_unit(target_units)
+        except ValueError:
+            error_handler(
+                f"Target units for {data.name} ({target_units}) are not recognised by cf-units.\n",
+                logger,
+                warn_extra="Units will not be converted.\n",
+                error_mode=error_mode,
+            )
+            return data
 
-    try:
-        _source_units = cf_units.Unit(source_units)
-    except ValueError:
-        error_handler(
-            f"Source units for {data.name} ({source_units}) are not recognised by cf-units.\n",
-            logger,
-            warn_extra="Units will not be converted.\n",
-            error_mode=error_mode,
-        )
-        return data
+        try:
+            _source_units = _cached_unit(source_units)
+        except ValueError:
+            error_handler(
+                f"Source units for {data.name} ({source_units}) are not recognised by cf-units.\n",
+                logger,
+                warn_extra="Units will not be converted.\n",
+                error_mode=error_mode,
+            )
+            return data
+
+        if _source_units == _target_units:
+            # Only the name differs (e.g. "m s-1" and "m/s"), there is nothing to convert
+            return data.assign_attrs({"units": target_units})
 
     try:
-        # cf-units not compatible with xarray objects, so operate at the numpy level
-        converted_values = _source_units.convert(data.values, _target_units)
+        if coefficients is None:
+            coefficients = _linear_coefficients(source_units, target_units)
+        if coefficients is not None:
+            return _convert_linear(data, *coefficients, target_units)
+        # cf-units not compatible with xarray objects, so operate at the numpy level,
+        # chunk by chunk for dask backed data
+        converted = xr.apply_ufunc(
+            _source_units.convert,
+            data,
+            _target_units,
+            dask="parallelized",
+            # cf-units keeps float32, anything else is converted as float64
+            output_dtypes=[np.float32 if data.dtype == np.float32 else np.float64],
+            keep_attrs=True,
+        )
     except Exception as err:
         error_handler(
-            f"Error while converting {_source_units} to {_target_units} for {data.name}.\n",
+            f"Error while converting {source_units} to {target_units} for {data.name}.\n",
             logger,
             warn_extra="Units will not be converted.\n",
             err=err,
@@ -86,7 +201,5 @@ def convert_units(
         )
         return data
 
-    # cf-units not compatible with xarray objects, so operate at the numpy level
-    data = (data * 0) + converted_values
-    data.assign_attrs({"units": source_units})
-    return data
+    converted.attrs["units"] = target_units
+    return converted
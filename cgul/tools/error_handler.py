@@ -2,6 +2,54 @@ import logging
 import typing as T
 
 
+def _ignore(
+    message: str,
+    logger: logging.Logger,
+    err: T.Union[Exception, str] = "",
+    warn_extra: str = "",
+) -> None:
+    pass
+
+
+def _raise(
+    message: str,
+    logger: logging.Logger,
+    err: T.Union[Exception, str] = "",
+    warn_extra: str = "",
+) -> None:
+    if err:
+        message = f"{message}\nTraceback:\n{err}"
+    raise RuntimeError(message)
+
+
+def _warn(
+    message: str,
+    logger: logging.Logger,
+    err: T.Union[Exception, str] = "",
+    warn_extra: str = "",
+) -> None:
+    # Skip building the message when warnings are not emitted by the logger
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    template = "%s"
+    args: T.List[T.Any] = [message]
+    if warn_extra:
+        template += " %s"
+        args.append(warn_extra)
+    if err:
+        template += "\nTraceback:\n%s"
+        args.append(err)
+    logger.warning(template, *args)
+
+
+# Unrecognised error modes fall back to "warn"
+_ERROR_HANDLERS: T.Dict[str, T.Callable[..., None]] = {
+    "ignore": _ignore,
+    "warn": _warn,
+    "raise": _raise,
+}
+
+
 def error_handler(
     message: str,
     logger: logging.Logger,
@@ -9,15 +57,6 @@ def error_handler(
     warn_extra: str = "",
     error_mode: str = "warn",
 ) -> None:
-    if error_mode == "ignore":
-        pass
-    elif error_mode == "raise":
-        if err:
-            message = f"{message}\nTraceback:\n{err}"
-        raise RuntimeError(message)
-    else:
-        if warn_extra:
-            message = f"{message} {warn_extra}"
-        if err:
-            message = f"{message}\nTraceback:\n{err}"
-        logger.warning(message)
+    _ERROR_HANDLERS.get(error_mode, _warn)(
+        message, logger, err=err, warn_extra=warn_extra
+    )
@@ -18,7 +18,10 @@
 #   Alessandro Amici - B-Open - https://bopen.eu
 #
 
+import concurrent.futures
+import functools
 import logging
+import os
 import typing as T
 import warnings
 from copy import deepcopy
@@ -31,6 +34,35 @@ LOG = logging.getLogger(__name__)
 
 DEFAULT_COORD_MODEL = coordinate_models.CADS
 
+# Minimum total size of the coordinates to translate before a thread pool is used
+PARALLEL_MIN_SIZE = 1_000_000
+
+
+def _compile_coord_model(
+    coord_model: T.Dict[str, T.Any],
+) -> T.Tuple[bool, T.Dict[str, T.Tuple[T.Union[str, None], T.Dict[str, T.Any]]]]:
+    """
+    Compile a coordinate model into its lower case flag and a {name: (out_name, c_model)} plan.
+
+    Names listed in the "aliases" of an entry are added to the plan, translating to the
+    entry's out_name (or the entry name). The c_model dictionaries are not copied.
+    """
+    lower_case = coord_model.get("_always_lower_case", False)
+    plan = {}
+    aliases = {}
+    for name, c_model in coord_model.items():
+        if not isinstance(c_model, dict):
+            continue
+        if "aliases" in c_model:
+            # aliases describe the coordinate model, they are not coordinate attributes
+            c_model = {key: val for key, val in c_model.items() if key != "aliases"}
+            for alias in coord_model[name]["aliases"]:
+                alias = alias.lower() if lower_case else alias
+                aliases[alias] = (c_model.get("out_name", name), c_model)
+        plan[name] = (c_model.get("out_name"), c_model)
+    # Names given explicitly in the coordinate model take priority over aliases
+    return lower_case, {**aliases, **plan}
+
 
 def coord_translator(
     coord: xr.DataArray,
@@ -65,34 +97,27 @@ def coord_translator(
         Data array for the coordinate translated to a format described by c_model
     """
     coord = tools.common_unit_fixes(coord, common_unit_names=common_unit_names)
-    if convert_units and ("units" in coord.attrs):
-        source_units = str(coord.attrs.get("units"))
-        target_units = c_model.get("units", source_units)
+    attrs = coord.attrs
+    target_units = c_model.get("units")
+    # Only convert when the coordinate model asks for specific units
+    if convert_units and (target_units is not None) and ("units" in attrs):
         coord = tools.convert_units(
             coord,
             target_units,
-            source_units,
+            str(attrs["units"]),
             LOG,
             error_mode=error_mode,
         )
+        attrs = coord.attrs
 
-    # Attributes in source data are given priority
-    coord_attrs = {
-        **c_model,
-        **coord.attrs,
-    }
-
+    # Attributes in source data are given priority.
     # Sometimes attributes are stored in the encoding (e.g. for time variables),
     # to remove conflicts when saving as netCDF we remove the attribute value here
+    encoding = coord.encoding
     coord_attrs = {
-        key: val for key, val in coord_attrs.items() if key not in coord.encoding.keys()
-    }
-    encoding_attrs = {
-        key: val for key, val in coord_attrs.items() if key in coord.encoding.keys()
+        key: val for key, val in {**c_model, **attrs}.items() if key not in encoding
     }
-
     coord = coord.assign_attrs(coord_attrs)
-    coord.encoding.update(encoding_attrs)
 
     return coord
 
@@ -113,7 +138,8 @@ def translate_coords(
         Dataset with the coordinates to be translated.
     coord_model : dictionary
         A dictionary providing the coordinate model to transalte the input
-        dataset to.
+        dataset to. Each coordinate entry may include a list of "aliases", other
+        coordinate names which are translated using the same entry.
     common_unit_names : dictionary
         A dictionary providing mapping of common names for units which are not recognised
         by cf-units to recognised cf-units, e.g. {'DegNorth': 'Degrees_North'}. Default is
@@ -133,58 +159,112 @@ def translate_coords(
     if coord_model is None:
         coord_model = DEFAULT_COORD_MODEL
 
-    lower_case = coord_model.get("_always_lower_case", False)
-    # First build dictionary of applicable coord models so we can deduce the order to change
-    update_order = []
-    c_models = {}
+    lower_case, plan = _compile_coord_model(coord_model)
+    # First build the (out_name, c_model) of each coordinate that needs translating
+    tasks = {}
     for coordinate in data.coords:
-        if lower_case:
-            _coordinate = str(coordinate).lower()
-        else:
-            _coordinate = str(coordinate)
+        _coordinate = coordinate if isinstance(coordinate, str) else str(coordinate)
+        if lower_case and not _coordinate.islower():
+            _coordinate = _coordinate.lower()
         # Prioritise standard_name in attributes (this fixes disagreement between grib and CF time vars)
-        _coordinate_standard_name = data[coordinate].attrs.get(
-            "standard_name", _coordinate
-        )
-        if _coordinate_standard_name in coord_model:
+        coord = data.coords[coordinate]
+        attrs = coord.attrs
+        _coordinate_standard_name = attrs.get("standard_name", _coordinate)
+        if _coordinate_standard_name in plan:
             _coordinate = _coordinate_standard_name
-        c_model = coord_model.get(_coordinate, {})
-        out_name = c_model.get("out_name", _coordinate)
-        c_models[coordinate] = deepcopy(c_model)
-        # Create safe order in which to update coordinates
-        if out_name in update_order:
-            update_order.append(coordinate)
-        else:
-            update_order.insert(0, coordinate)
+        out_name, c_model = plan.get(_coordinate, (None, {}))
+        out_name = out_name or coordinate
+        if (
+            out_name == coordinate
+            and _has_attrs(attrs, c_model)
+            and not _needs_unit_fixes(attrs, common_unit_names)
+        ):
+            # Already described by the coordinate model (or not in it) and nothing
+            # to fix, leave untouched
+            continue
+        # Copy so translated coordinates do not share attribute values with the model
+        tasks[coordinate] = (out_name, coord, deepcopy(c_model))
 
-    for coordinate in data.coords:
-        c_model = c_models[coordinate]
-        out_name = c_model.get("out_name", coordinate)
+    translate = functools.partial(
+        _try_coord_translator,
+        common_unit_names=common_unit_names,
+        convert_units=convert_units,
+    )
+    coords = [coord for _, coord, _ in tasks.values()]
+    c_models = [c_model for _, _, c_model in tasks.values()]
+    if len(coords) > 1 and sum(coord.size for coord in coords) >= PARALLEL_MIN_SIZE:
+        # Large coordinates are translated in threads, numpy releases the GIL
+        max_workers = min(len(coords), os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(translate, coords, c_models))
+    else:
+        results = list(map(translate, coords, c_models))
+
+    new_coords = {}
+    rename_map = {}
+    for (coordinate, (out_name, _, _)), result in zip(tasks.items(), results):
+        if isinstance(result, Exception):
+            _coordinate_error(coordinate, result, error_mode)
+            continue
+        new_coords[coordinate] = result
+        if out_name != coordinate:
+            rename_map[coordinate] = out_name
+
+    if not new_coords:
+        return data
+
+    # Apply all the translated coordinates and new names in one go, rather than
+    # rebuilding the xarray object once per coordinate
+    data = data.assign_coords(new_coords)
+    if not rename_map:
+        return data
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
         try:
-            data = data.assign_coords(
-                {
-                    coordinate: coord_translator(
-                        data.coords[coordinate],
-                        c_model,
-                        common_unit_names=common_unit_names,
-                        convert_units=convert_units,
-                        error_mode="warn",
-                    )
-                }
-            )
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=UserWarning)
-                data = data.rename({coordinate: out_name})
-        except Exception as err:
-            if error_mode == "ignore":
-                pass
-            elif error_mode == "raise":
-                raise RuntimeError(
-                    f"Error while translating coordinate: {coordinate}.\n Traceback:\n{err}"
-                )
-            else:
-                LOG.warning(
-                    f"Error while translating coordinate: {coordinate}.\n Traceback:\n{err}"
-                )
+            data = data.rename(rename_map)
+        except Exception:
+            # Conflicting names, rename one at a time so only the offending
+            # coordinates are left untranslated
+            for coordinate, out_name in rename_map.items():
+                try:
+                    data = data.rename({coordinate: out_name})
+                except Exception as err:
+                    _coordinate_error(coordinate, err, error_mode)
 
     return data
+
+
+def _try_coord_translator(
+    coord: xr.DataArray, c_model: T.Dict[str, T.Any], **kwargs: T.Any
+) -> T.Union[xr.DataArray, Exception]:
+    try:
+        return coord_translator(coord, c_model, error_mode="warn", **kwargs)
+    except Exception as err:
+        return err
+
+
+def _has_attrs(attrs: T.Dict[T.Hashable, T.Any], c_model: T.Dict[str, T.Any]) -> bool:
+    try:
+        return c_model.items() <= attrs.items()
+    except ValueError:
+        # e.g. array valued attributes which cannot be compared
+        return False
+
+
+def _needs_unit_fixes(
+    attrs: T.Dict[T.Hashable, T.Any],
+    common_unit_names: T.Union[T.Dict[str, str], None] = None,
+) -> bool:
+    if common_unit_names is None:
+        common_unit_names = tools.COMMON_UNIT_NAMES
+    units = attrs.get("units", "")
+    return "Units" in attrs or (isinstance(units, str) and units in common_unit_names)
+
+
+def _coordinate_error(coordinate: T.Hashable, err: Exception, error_mode: str) -> None:
+    tools.error_handler(
+        f"Error while translating coordinate: {coordinate}.",
+        LOG,
+        err=err,
+        error_mode=error_mode,
+    )
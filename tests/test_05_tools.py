@@ -1,6 +1,16 @@
+import logging
+import pathlib
+import subprocess
+import sys
+
 import _test_objects
+import cf_units
+import numpy as np
+import pytest
 
 import cgul
+from cgul import _kernels
+from cgul.tools.convert_units import _FAST_CONVERSIONS, _cached_unit
 
 # Create test data array and dataset to apply methods to
 TEST_DA = _test_objects.TEST_DA
@@ -29,3 +39,132 @@ def test_common_unit_fixes() -> None:
         TEST_DA.assign_attrs({"Units": "Dimensionless"})
     )
     assert result.attrs == TEST_DA.assign_attrs({"units": "1"}).attrs
+
+
+def test_cached_unit() -> None:
+    _cached_unit.cache_clear()
+    assert _cached_unit("km") is _cached_unit("km")
+    assert _cached_unit.cache_info().hits == 1
+
+
+def test_convert_units_equivalent() -> None:
+    data = TEST_DA["Depth"].assign_attrs({"units": "m s-1"})
+    result = cgul.tools.convert_units(data, target_units="m/s")
+    assert all(result.values == data.values)
+    assert result.attrs["units"] == "m/s"
+
+    result = cgul.tools.convert_units(
+        TEST_DA["Depth"].astype(float), source_units="degC", target_units="K"
+    )
+    assert all(result.values == [273.15, 274.15])
+    assert result.attrs["units"] == "K"
+
+
+def test_convert_units_non_linear() -> None:
+    data = TEST_DA["Depth"].assign_attrs({"units": "lg(re 1 W)"})
+    result = cgul.tools.convert_units(data, target_units="W")
+    assert all(result.values == [1.0, 10.0])
+    assert result.attrs["units"] == "W"
+    assert data.attrs["units"] == "lg(re 1 W)"
+
+
+def test_fast_conversions() -> None:
+    values = np.array([0.0, 1.0, 10.0])
+    for (source, target), (scale, offset) in _FAST_CONVERSIONS.items():
+        expected = cf_units.Unit(source).convert(values, cf_units.Unit(target))
+        np.testing.assert_allclose(values * scale + offset, expected)
+
+
+def test_linear_convert() -> None:
+    # Below NUMBA_MIN_SIZE numpy is always used
+    values = np.arange(10)
+    result = _kernels.linear_convert(values, 1e3, 0.5, np.dtype("float64"))
+    np.testing.assert_allclose(result, values * 1e3 + 0.5)
+    assert result.dtype == np.float64
+
+
+def test_linear_convert_numba() -> None:
+    pytest.importorskip("numba")
+
+    assert _kernels._numba_linear_convert() is not None
+    values = np.arange(_kernels.NUMBA_MIN_SIZE)
+    result = _kernels.linear_convert(values, 1e3, 0.5, np.dtype("float64"))
+    np.testing.assert_allclose(result, values * 1e3 + 0.5)
+    assert result.dtype == np.float64
+
+
+def test_linear_convert_worker_thread_exits() -> None:
+    pytest.importorskip("numba")
+
+    # Worker threads are used by dask and the translate_coords thread pool, the
+    # interpreter must still exit after the kernel has run in one
+    script = (
+        "import threading\n"
+        "import numpy as np\n"
+        "from cgul import _kernels\n"
+        "values = np.arange(_kernels.NUMBA_MIN_SIZE)\n"
+        "thread = threading.Thread(\n"
+        "    target=_kernels.linear_convert,\n"
+        "    args=(values, 1e3, 0.5, np.dtype('float64')),\n"
+        ")\n"
+        "thread.start()\n"
+        "thread.join()\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=pathlib.Path(__file__).parents[1],
+        check=True,
+        timeout=120,
+    )
+
+
+def test_error_handler(caplog: pytest.LogCaptureFixture) -> None:
+    logger = logging.getLogger("cgul.test")
+    cgul.tools.error_handler("message", logger, err="error", warn_extra="extra")
+    assert caplog.messages == ["message extra\nTraceback:\nerror"]
+
+    with pytest.raises(RuntimeError, match="message\nTraceback:\nerror"):
+        cgul.tools.error_handler("message", logger, err="error", error_mode="raise")
+
+
+def test_convert_units_large_offset() -> None:
+    values = np.array([0.0, 1.7e9])
+    for source, target in [
+        ("seconds since 1970-01-01", "days since 1900-01-01"),
+        ("K", "degF"),
+        ("degC", "K"),
+    ]:
+        data = TEST_DA["Depth"].copy(data=values).assign_attrs({"units": source})
+        result = cgul.tools.convert_units(data, target_units=target)
+        expected = cf_units.Unit(source).convert(values, cf_units.Unit(target))
+        np.testing.assert_allclose(result.values, expected, rtol=1e-12)
+
+
+def test_convert_units_dask() -> None:
+    dask_array = pytest.importorskip("dask.array")
+
+    for dtype in [np.float64, np.float32]:
+        data = TEST_DA["Depth"].astype(dtype).chunk(1)
+        # Table, probed linear and non-linear conversions
+        for source, target in [("km", "m"), ("degF", "K"), ("lg(re 1 W)", "W")]:
+            result = cgul.tools.convert_units(
+                data.assign_attrs({"units": source}), target_units=target
+            )
+            assert isinstance(result.data, dask_array.Array)
+            assert result.attrs["units"] == target
+            expected = cf_units.Unit(source).convert(data.values, cf_units.Unit(target))
+            computed = result.compute()
+            assert computed.dtype == result.dtype
+            np.testing.assert_allclose(computed.values, expected, rtol=1e-6)
+
+
+def test_convert_units_error_mode() -> None:
+    data = TEST_DA["Depth"].copy(data=["a", "b"])
+    # Table and cf-units conversions
+    for source, target in [("km", "m"), ("m s-1", "km h-1")]:
+        data = data.assign_attrs({"units": source})
+        result = cgul.tools.convert_units(data, target, error_mode="ignore")
+        assert result is data
+
+        with pytest.raises(RuntimeError, match="Error while converting"):
+            cgul.tools.convert_units(data, target, error_mode="raise")
@@ -1,4 +1,10 @@
+import concurrent.futures
+import sys
+from copy import deepcopy
+from unittest import mock
+
 import _test_objects
+import pytest
 import xarray as xr
 
 import cgul
@@ -31,3 +37,51 @@ def test_coord_translator() -> None:
     RESULT.name = "Lat"
     xr.testing.assert_identical(RESULT, result)
     assert result.to_dict() == RESULT.to_dict()
+
+
+def test_translate_coords_untouched() -> None:
+    data = xr.DataArray([1, 2], name="test", coords={"x": [0, 1]}, dims=["x"])
+    result = cgul.translate_coords(data, coord_model=cgul.coordinate_models.CADS)
+    assert result is data
+
+    result = cgul.translate_coords(RESULT_DA, coord_model=cgul.coordinate_models.CADS)
+    assert result is RESULT_DA
+
+
+def test_translate_coords_aliases() -> None:
+    coord_model = {
+        "_always_lower_case": True,
+        "depth": {**cgul.coordinate_models.CADS["depth"], "aliases": ["Depth"]},
+        "latitude": {**cgul.coordinate_models.CADS["latitude"], "aliases": ["Lat"]},
+        "longitude": {**cgul.coordinate_models.CADS["longitude"], "aliases": ["Lon"]},
+    }
+    result = cgul.translate_coords(TEST_DA, coord_model=coord_model)
+    xr.testing.assert_identical(RESULT_DA, result)
+
+
+def test_translate_coords_model_not_shared() -> None:
+    coord_model = deepcopy(cgul.coordinate_models.CADS)
+    coord_model["x"] = {"flag_values": [1, 2]}
+    data = xr.DataArray([1, 2], name="test", coords={"x": [0, 1]}, dims=["x"])
+    result = cgul.translate_coords(data, coord_model=coord_model)
+    result.x.attrs["flag_values"].append(3)
+    result = cgul.translate_coords(data, coord_model=coord_model)
+    assert result.x.attrs["flag_values"] == [1, 2]
+
+    # Changes to the coordinate model after it has been used are applied
+    coord_model["depth"]["units"] = "km"
+    result = cgul.translate_coords(TEST_DA, coord_model=coord_model)
+    assert all(result.depth.values == TEST_DA.Depth.values)
+    assert result.depth.attrs["units"] == "km"
+
+
+def test_translate_coords_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    serial = cgul.translate_coords(TEST_DS, coord_model=cgul.coordinate_models.CADS)
+    monkeypatch.setattr(sys.modules["cgul.translate_coords"], "PARALLEL_MIN_SIZE", 1)
+    with mock.patch(
+        "concurrent.futures.ThreadPoolExecutor",
+        wraps=concurrent.futures.ThreadPoolExecutor,
+    ) as executor:
+        result = cgul.translate_coords(TEST_DS, coord_model=cgul.coordinate_models.CADS)
+    executor.assert_called_once()
+    xr.testing.assert_identical(serial, result)
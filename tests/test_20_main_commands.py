@@ -1,7 +1,8 @@
-import tempfile
+import pathlib
 
 import _test_objects
 import click.testing
+import pytest
 
 from cgul import cli
 
@@ -10,16 +11,19 @@ TEST_DS = _test_objects.TEST_DS
 RESULT_DS = _test_objects.RESULT_DS
 
 
-def test_cfgrib_cli_to_netcdf() -> None:
+@pytest.fixture(scope="session")
+def test_ds_path(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    path = tmp_path_factory.mktemp("data") / "test_ds.nc"
+    TEST_DS.to_netcdf(path)
+    return path
+
+
+def test_cfgrib_cli_to_netcdf(test_ds_path: pathlib.Path) -> None:
     runner = click.testing.CliRunner()
 
-    with tempfile.NamedTemporaryFile() as tmp:
-        TEST_DS.to_netcdf(tmp.name)
-        res = runner.invoke(cli.cgul_cli, ["harmonise", "--check", tmp.name])
-        assert res.exit_code == 0
+    res = runner.invoke(cli.cgul_cli, ["harmonise", "--check", str(test_ds_path)])
+    assert res.exit_code == 0
 
-    with tempfile.NamedTemporaryFile() as tmp:
-        TEST_DS.to_netcdf(tmp.name)
-        res = runner.invoke(cli.cgul_cli, ["harmonise", tmp.name])
-        assert res.exit_code == 0
-        assert res.output == ""
+    res = runner.invoke(cli.cgul_cli, ["harmonise", str(test_ds_path)])
+    assert res.exit_code == 0
+    assert res.output == ""